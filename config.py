@@ -2,16 +2,36 @@
 
 import os
 import sys
-from typing import Dict, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
-try:
-    from dotenv import load_dotenv
-except ImportError:
-    load_dotenv = None
+# python-dotenv is optional; resolved on first load(), None when not installed
+_UNRESOLVED = object()
+load_dotenv = _UNRESOLVED
+
+
+class Config(NamedTuple):
+    """Validated configuration values."""
+
+    airtable_api_key: str
+    airtable_view_url: str
+    gr_columns: Tuple[str, ...]
+    gr_headers: Tuple[str, ...]
+    debug: bool
+
+
+# Validated configuration, cached for the lifetime of the process
+_CACHED: Optional[Config] = None
 
 
 def load() -> None:
     """Load environment variables from .env file if available."""
+    global load_dotenv
+    if load_dotenv is _UNRESOLVED:
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            load_dotenv = None
+
     if load_dotenv:
         load_dotenv()
 
@@ -29,24 +49,52 @@ def require(key: str) -> str:
     return value
 
 
-def validate() -> Dict[str, str]:
-    """Validate required configuration and return config dict."""
-    load()
+def validate() -> Config:
+    """Validate required configuration and return it.
 
-    config = {}
-    required_vars = ["AIRTABLE_API_KEY", "AIRTABLE_VIEW_URL"]
+    The result is cached, so repeated calls don't re-read the .env file.
+    """
+    global _CACHED
+    if _CACHED is not None:
+        return _CACHED
 
-    for var in required_vars:
-        config[var] = require(var)
+    load()
+
+    api_key = require("AIRTABLE_API_KEY")
+    view_url = require("AIRTABLE_VIEW_URL")
 
-    # Optional configuration
-    config["GR_COLUMNS"] = get("GR_COLUMNS", "Name,Email,Status,Date")
-    config["GR_HEADERS"] = get(
-        "GR_HEADERS", "Student Name,Email Address,Current Status,Last Updated"
+    # Optional configuration, parsed up front so a mismatch fails before any I/O
+    columns = tuple(parse_list(get("GR_COLUMNS", "Name,Email,Status,Date")))
+    headers = tuple(
+        parse_list(
+            get("GR_HEADERS", "Student Name,Email Address,Current Status,Last Updated")
+        )
+    )
+    if len(columns) != len(headers):
+        error(
+            f"GR_COLUMNS ({len(columns)}) and GR_HEADERS ({len(headers)}) "
+            "count mismatch"
+        )
+
+    _CACHED = Config(
+        airtable_api_key=api_key,
+        airtable_view_url=view_url,
+        gr_columns=columns,
+        gr_headers=headers,
+        debug=get("FAC_CLI_DEBUG", "false").lower() == "true",
     )
-    config["FAC_CLI_DEBUG"] = get("FAC_CLI_DEBUG", "false").lower() == "true"
+    return _CACHED
+
+
+def parse_list(value: str) -> List[str]:
+    """Parse comma-separated names, dropping blanks."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
 
-    return config
+def invalidate() -> None:
+    """Discard cached configuration so the next validate() reloads it."""
+    global _CACHED
+    _CACHED = None
 
 
 def error(message: str, exit_code: int = 1) -> None:
@@ -1,69 +1,175 @@
 """Terminal display formatting for FAC CLI."""
 
+import os
 import sys
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
 
-try:
-    from tabulate import tabulate
-except ImportError:
-    print(
-        "Error: tabulate library not installed. Run: pip install -r requirements.txt",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+# Imported on first use by load_tabulate() to keep CLI startup fast
+tabulate = None
 
+# Longer cell values are cut to this width, ending in ELLIPSIS
+MAX_CELL_WIDTH = 50
+ELLIPSIS = "..."
+_KEEP = MAX_CELL_WIDTH - len(ELLIPSIS)
 
-def format(data: List[Dict], columns: List[str], headers: List[str]) -> List[List[str]]:
+# Lines held back by batch() until they can be written to stdout at once
+_BATCH: Optional[List[str]] = None
+
+
+def format(
+    data: List[Dict], columns: Sequence[str], headers: Sequence[str]
+) -> List[List[str]]:
     """Format data for display by selecting columns."""
     if len(columns) != len(headers):
         error(f"Columns ({len(columns)}) and headers ({len(headers)}) count mismatch")
 
+    # A plain nested loop is deliberate: on CPython 3.11 it measures as fast
+    # as or faster than comprehension, map(row.get, ...) or itemgetter forms.
+    # The type() check below is a separate trade-off: a few percent faster
+    # on text-only views, a few percent slower on mixed-type rows.
     formatted = []
     for row in data:
         formatted_row = []
         for column in columns:
-            value = row.get(column, "")
-            # Convert to string and handle None values
-            str_value = str(value) if value is not None else ""
+            value = row.get(column)
+            # Convert to string and handle None values; most Airtable
+            # fields are already text, so skip str() for those
+            if type(value) is not str:
+                value = "" if value is None else str(value)
             # Truncate long values for better display
-            if len(str_value) > 50:
-                str_value = str_value[:47] + "..."
-            formatted_row.append(str_value)
+            if len(value) > MAX_CELL_WIDTH:
+                value = value[:_KEEP] + ELLIPSIS
+            formatted_row.append(value)
         formatted.append(formatted_row)
 
     return formatted
 
 
-def table(data: List[List[str]], headers: List[str], style: str = "grid") -> str:
+def table(data: List[List[str]], headers: Sequence[str], style: str = "grid") -> str:
     """Create formatted table string."""
     if not data:
         return "No data to display"
 
+    # Plain single-line ASCII text doesn't need tabulate's full layout engine;
+    # wide or combining characters need its display-width padding
+    if (
+        style == "grid"
+        and all(header.isascii() for header in headers)
+        and all(cell.isascii() and "\n" not in cell for row in data for cell in row)
+    ):
+        return grid(data, headers)
+
+    # Cells are already display strings; numparse would rewrite values such
+    # as "1.50" and right-align them, unlike the grid() fast path
+    render = load_tabulate()
     try:
-        return tabulate(data, headers=headers, tablefmt=style)
+        return render(data, headers=headers, tablefmt=style, disable_numparse=True)
     except Exception as e:
         error(f"Error formatting table: {str(e)}")
 
 
-def print_table(data: List[Dict], columns: List[str], headers: List[str]) -> None:
+def grid(data: List[List[str]], headers: Sequence[str]) -> str:
+    """Render single-line ASCII cells as tabulate's grid with numparse off."""
+    # Like tabulate, trim surrounding whitespace from cells but not headers
+    data = [[cell.strip() for cell in row] for row in data]
+
+    # Like tabulate, leave at least two spaces' room around each header
+    widths = [len(header) + 2 for header in headers]
+    for row in data:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    def line(cells: Sequence[str]) -> str:
+        return "| " + " | ".join(c.ljust(w) for c, w in zip(cells, widths)) + " |"
+
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    lines = [border, line(headers), border.replace("-", "=")]
+    for row in data:
+        lines.append(line(row))
+        lines.append(border)
+
+    return "\n".join(lines)
+
+
+def load_tabulate():
+    """Import tabulate on first use and cache it at module level."""
+    global tabulate
+    if tabulate is None:
+        try:
+            from tabulate import tabulate as render
+        except ImportError:
+            error(
+                "tabulate library not installed. Run: pip install -r requirements.txt"
+            )
+        tabulate = render
+    return tabulate
+
+
+def print_table(
+    data: List[Dict], columns: Sequence[str], headers: Sequence[str]
+) -> None:
     """Print formatted table to terminal."""
     if not data:
-        print("No data available")
+        emit("No data available")
         return
 
     formatted_data = format(data, columns, headers)
     table_output = table(formatted_data, headers)
-    print(table_output)
+
+    # A batch writes the whole table with one write() and flush
+    with batch():
+        emit(table_output)
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Hold stdout output inside the block and write it in a single call."""
+    global _BATCH
+    if _BATCH is not None:
+        # Already batching; the outer block writes everything
+        yield
+        return
+
+    _BATCH = []
+    try:
+        yield
+    finally:
+        lines, _BATCH = _BATCH, None
+        if lines:
+            write("\n".join(lines) + "\n")
+
+
+def write(text: str) -> None:
+    """Write text to stdout and flush, tolerating a closed pipe."""
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); send any remaining
+        # output to devnull so the interpreter doesn't fail flushing at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+
+
+def emit(text: str) -> None:
+    """Print text to stdout, or hold it while a batch is open."""
+    if _BATCH is not None:
+        _BATCH.append(text)
+    else:
+        print(text)
 
 
 def print_success(message: str) -> None:
     """Print success message."""
-    print(f"✓ {message}")
+    emit(f"✓ {message}")
 
 
 def print_info(message: str) -> None:
     """Print informational message."""
-    print(f"ℹ {message}")
+    emit(f"ℹ {message}")
 
 
 def print_warning(message: str) -> None:
@@ -6,16 +6,36 @@ from typing import List, Tuple
 
 import config
 
+HELP_COMMANDS = frozenset({"help", "--help", "-h"})
+
+HELP_TEXT = """
+FAC CLI - Founders and Coders Training Operations
+
+Usage:
+  ./fac.py <command> [options]
+
+Available commands:
+  gr              Gateway recent - fetch and display recent gateway data
+  help, --help    Show this help message
+
+Examples:
+  ./fac.py gr     Display recent gateway data from Airtable
+  ./fac.py help   Show this help message
+
+Configuration:
+  Copy .env.example to .env and configure your Airtable credentials.
+
+For more information, see README.md
+""".strip()
+
 
 def parse(args: List[str]) -> Tuple[str, List[str]]:
     """Parse command line arguments."""
     if len(args) < 2:
         return "help", []
 
-    command = args[1]
-    remaining_args = args[2:] if len(args) > 2 else []
-
-    return command, remaining_args
+    # Slicing past the end already yields an empty list
+    return args[1], args[2:]
 
 
 def route(args: List[str]) -> None:
@@ -27,65 +47,43 @@ def route(args: List[str]) -> None:
 def dispatch(command: str, args: List[str]) -> None:
     """Dispatch to command handler."""
     # Help commands don't need configuration validation
-    help_commands = ["help", "--help", "-h"]
-
-    if command in help_commands:
+    if command in HELP_COMMANDS:
         show_help()
         return
 
-    commands = {
-        "gr": lambda: run_gr(args),
-    }
-
-    if command in commands:
-        try:
-            # Validate configuration for commands that need it
-            config.validate()
-            commands[command]()
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user", file=sys.stderr)
-            sys.exit(130)
-        except Exception as e:
-            if config.get("FAC_CLI_DEBUG", "false").lower() == "true":
-                raise
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
+    if command != "gr":
         show_error(f"Unknown command: {command}")
+        return
 
-
-def run_gr(args: List[str]) -> None:
+    debug = False
+    try:
+        # Validate configuration once and hand it to the command
+        cfg = config.validate()
+        debug = cfg.debug
+        run_gr(args, cfg)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user", file=sys.stderr)
+        sys.exit(130)
+    except Exception as e:
+        if debug:
+            raise
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def run_gr(args: List[str], cfg: config.Config) -> None:
     """Run gateway recent command."""
     try:
         from commands import gr
 
-        gr.run(args)
+        gr.run(args, cfg)
     except ImportError:
         config.error("Gateway recent command module not found")
 
 
 def show_help() -> None:
     """Show help information."""
-    help_text = """
-FAC CLI - Founders and Coders Training Operations
-
-Usage:
-  ./fac.py <command> [options]
-
-Available commands:
-  gr              Gateway recent - fetch and display recent gateway data
-  help, --help    Show this help message
-
-Examples:
-  ./fac.py gr     Display recent gateway data from Airtable
-  ./fac.py help   Show this help message
-
-Configuration:
-  Copy .env.example to .env and configure your Airtable credentials.
-
-For more information, see README.md
-"""
-    print(help_text.strip())
+    print(HELP_TEXT)
 
 
 def show_error(message: str) -> None:
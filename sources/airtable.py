@@ -1,16 +1,24 @@
 """Airtable API integration for FAC CLI."""
 
+import re
 import sys
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
-try:
+if TYPE_CHECKING:
     import requests
+
+# orjson is an optional, faster JSON decoder for large views
+try:
+    from orjson import loads
 except ImportError:
-    print(
-        "Error: requests library not installed. Run: pip install -r requirements.txt",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+    from json import loads
+
+# Shared HTTP session, created on first request by session()
+_SESSION: Optional["requests.Session"] = None
+
+# User-friendly view URL: https://airtable.com/appXXXXX/tblXXXXX/viwXXXXX
+# Anything after the view id (trailing slash, record path, query) is ignored.
+_VIEW_URL = re.compile(r"https://airtable\.com/(app[^/]+)/(tbl[^/]+)/(viw[^/?#]+)")
 
 
 def auth(api_key: str) -> Dict[str, str]:
@@ -21,10 +29,52 @@ def auth(api_key: str) -> Dict[str, str]:
     }
 
 
-def request(url: str, headers: Dict[str, str], timeout: int = 30) -> requests.Response:
+def load_requests():
+    """Import requests on first use so commands that don't need it start fast."""
+    try:
+        import requests
+    except ImportError:
+        error("requests library not installed. Run: pip install -r requirements.txt")
+    return requests
+
+
+def session() -> "requests.Session":
+    """Get the shared session, which keeps connections alive between requests.
+
+    Rate limits and transient server errors are retried with backoff before
+    request() reports them. Read timeouts are not retried, so a stalled
+    request fails after one timeout with the timeout message.
+    """
+    global _SESSION
+    if _SESSION is None:
+        requests = load_requests()
+        from urllib3.util.retry import Retry
+
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=4, max_retries=retries
+        )
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", adapter)
+    return _SESSION
+
+
+def request(
+    url: str,
+    headers: Dict[str, str],
+    timeout: float = 30,
+    params: Optional[Dict[str, str]] = None,
+) -> "requests.Response":
     """Make HTTP request to Airtable API."""
+    requests = load_requests()
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = session().get(url, headers=headers, params=params, timeout=timeout)
         response.raise_for_status()
         return response
     except requests.exceptions.Timeout:
@@ -45,7 +95,12 @@ def request(url: str, headers: Dict[str, str], timeout: int = 30) -> requests.Re
 
 
 def get(api_key: str, view_url: str) -> List[Dict]:
-    """Get data from Airtable view."""
+    """Get data from every page of an Airtable view."""
+    return list(stream(api_key, view_url))
+
+
+def stream(api_key: str, view_url: str) -> Iterator[Dict]:
+    """Yield field data for each record in an Airtable view, page by page."""
     if not api_key or not view_url:
         error("Airtable API key and view URL are required")
 
@@ -53,17 +108,30 @@ def get(api_key: str, view_url: str) -> List[Dict]:
     api_url = convert_url(view_url)
 
     headers = auth(api_key)
-    response = request(api_url, headers)
+    params: Dict[str, str] = {}
+
+    while True:
+        data = parse(request(api_url, headers, params=params))
+        yield from extract(data["records"])
+
+        # Airtable returns an offset while there are more pages to fetch
+        offset = data.get("offset")
+        if not offset:
+            return
+        params = {"offset": offset}
 
+
+def parse(response: "requests.Response") -> Dict:
+    """Parse one page of an Airtable list-records response."""
     try:
-        data = response.json()
+        data = loads(response.content)
     except ValueError:
         error("Invalid response from Airtable API. Expected JSON.")
 
     if "records" not in data:
         error("Unexpected response format from Airtable. Missing 'records' field.")
 
-    return extract(data["records"])
+    return data
 
 
 def convert_url(url: str) -> str:
@@ -72,52 +140,22 @@ def convert_url(url: str) -> str:
     if url.startswith("https://api.airtable.com/"):
         return url
 
-    # Parse user-friendly URL format: https://airtable.com/appXXXXX/tblXXXXX/viwXXXXX
-    if not url.startswith("https://airtable.com/"):
+    match = _VIEW_URL.match(url)
+    if not match:
         error(
             "Invalid Airtable URL. Expected format: https://airtable.com/appXXXXX/tblXXXXX/viwXXXXX"
         )
 
-    # Extract components from URL
-    parts = url.replace("https://airtable.com/", "").split("/")
-
-    if len(parts) < 3:
-        error(
-            "Invalid Airtable URL format. Expected: https://airtable.com/appXXXXX/tblXXXXX/viwXXXXX"
-        )
-
-    app_id = parts[0]  # appXXXXX
-    table_id = parts[1]  # tblXXXXX
-    view_id = parts[2]  # viwXXXXX
-
-    # Validate component formats
-    if not (
-        app_id.startswith("app")
-        and table_id.startswith("tbl")
-        and view_id.startswith("viw")
-    ):
-        error(
-            "Invalid Airtable URL components. Expected appXXXXX/tblXXXXX/viwXXXXX format"
-        )
-
-    # Convert to API URL format
-    api_url = f"https://api.airtable.com/v0/{app_id}/{table_id}?view={view_id}"
-
-    return api_url
+    app_id, table_id, view_id = match.groups()
+    return f"https://api.airtable.com/v0/{app_id}/{table_id}?view={view_id}"
 
 
 def extract(records: List[Dict]) -> List[Dict]:
     """Extract field data from Airtable records."""
-    extracted = []
-
-    for record in records:
-        if "fields" in record:
-            extracted.append(record["fields"])
-        else:
-            # Handle records without fields gracefully
-            continue
-
-    return extracted
+    # Records without fields are skipped
+    return [
+        fields for record in records if (fields := record.get("fields")) is not None
+    ]
 
 
 def error(message: str, exit_code: int = 1) -> None:
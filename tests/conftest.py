@@ -0,0 +1,69 @@
+"""Shared pytest configuration for FAC CLI tests."""
+
+import os
+import pathlib
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Make the project root importable regardless of where pytest is run from,
+# without stacking duplicate entries if this module is imported again
+ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Import every patch target up front so string patch paths resolve from
+# sys.modules instead of going through the import system mid-test. This
+# loads orjson (or json) with sources.airtable; tabulate and requests stay
+# lazy until a test uses them
+import config  # noqa: E402
+import display  # noqa: E402, F401
+from commands import gr  # noqa: E402, F401
+from sources import airtable  # noqa: E402, F401
+
+
+def pytest_addoption(parser):
+    """Add the --run-slow opt-in for tests marked slow."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (always run when CI is set)",
+    )
+
+
+def in_ci() -> bool:
+    """Whether CI is set, as CI providers do with values like "true" or "1"."""
+    return os.environ.get("CI", "").strip().lower() not in ("", "0", "false")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given or running in CI."""
+    if config.getoption("--run-slow") or in_ci():
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def valid_config():
+    """Validated configuration as returned by config.validate()."""
+    return config.Config(
+        airtable_api_key="test",
+        airtable_view_url="https://airtable.com/app123/tbl456/viw789",
+        gr_columns=("Name",),
+        gr_headers=("Student Name",),
+        debug=False,
+    )
+
+
+@pytest.fixture
+def mock_validate(monkeypatch, valid_config):
+    """Replace config.validate with a mock returning valid_config."""
+    mock = Mock(return_value=valid_config)
+    monkeypatch.setattr(config, "validate", mock)
+    return mock
@@ -1,12 +1,10 @@
 """Tests for Airtable integration module."""
 
+import json
 import pytest
-import sys
+import socket
 from unittest.mock import Mock, patch
 
-# Add parent directory to path for imports
-sys.path.insert(0, "..")
-
 from sources import airtable
 
 
@@ -30,11 +28,18 @@ class TestAirtableURLConversion:
 
     def test_should_handle_urls_with_trailing_slash(self):
         """Test URL conversion with trailing slash."""
-        user_url = "https://airtable.com/appEXAMPLE123456/tblEXAMPLE789012/viwEXAMPLE345678/"
+        user_url = (
+            "https://airtable.com/appEXAMPLE123456/tblEXAMPLE789012/viwEXAMPLE345678/"
+        )
         expected = "https://api.airtable.com/v0/appEXAMPLE123456/tblEXAMPLE789012?view=viwEXAMPLE345678"
-        result = airtable.convert_url(
-            user_url.rstrip("/")
-        )  # Function should handle this
+        result = airtable.convert_url(user_url)
+        assert result == expected
+
+    def test_should_ignore_query_string_after_view_id(self):
+        """Test that query parameters on the view URL are dropped."""
+        user_url = "https://airtable.com/app123/tbl456/viw789?blocks=hide"
+        expected = "https://api.airtable.com/v0/app123/tbl456?view=viw789"
+        result = airtable.convert_url(user_url)
         assert result == expected
 
     def test_should_raise_error_for_invalid_url_format(self):
@@ -109,3 +114,153 @@ class TestAirtableExtract:
         """Test handling of empty records list."""
         result = airtable.extract([])
         assert result == []
+
+
+class TestAirtableGet:
+    """Test fetching records across paginated responses."""
+
+    @staticmethod
+    def page(records, offset=None):
+        """Build a mock response for one page of records."""
+        data = {"records": records}
+        if offset:
+            data["offset"] = offset
+
+        response = Mock()
+        response.content = json.dumps(data).encode()
+        return response
+
+    @patch("sources.airtable.request")
+    def test_should_return_records_from_single_page(self, mock_request):
+        """Test that a response without offset is fetched once."""
+        mock_request.return_value = self.page([{"fields": {"Name": "John"}}])
+
+        result = airtable.get("key", "https://airtable.com/app123/tbl456/viw789")
+
+        assert result == [{"Name": "John"}]
+        mock_request.assert_called_once()
+        assert mock_request.call_args[1]["params"] == {}
+
+    @patch("sources.airtable.request")
+    def test_should_follow_offsets_across_pages(self, mock_request):
+        """Test that every page is requested until no offset is returned."""
+        mock_request.side_effect = [
+            self.page([{"fields": {"Name": "John"}}], offset="itr1/rec1"),
+            self.page([{"fields": {"Name": "Jane"}}], offset="itr2/rec2"),
+            self.page([{"fields": {"Name": "Jim"}}]),
+        ]
+
+        result = airtable.get("key", "https://airtable.com/app123/tbl456/viw789")
+
+        assert result == [{"Name": "John"}, {"Name": "Jane"}, {"Name": "Jim"}]
+        assert [c[1]["params"] for c in mock_request.call_args_list] == [
+            {},
+            {"offset": "itr1/rec1"},
+            {"offset": "itr2/rec2"},
+        ]
+
+    @patch("sources.airtable.request")
+    def test_should_exit_when_records_field_missing(self, mock_request):
+        """Test error handling for responses without records."""
+        response = Mock()
+        response.content = b'{"error": "nope"}'
+        mock_request.return_value = response
+
+        with pytest.raises(SystemExit):
+            airtable.get("key", "https://airtable.com/app123/tbl456/viw789")
+
+    @patch("sources.airtable.request")
+    def test_should_exit_when_response_is_not_json(self, mock_request):
+        """Test error handling for non-JSON responses."""
+        response = Mock()
+        response.content = b"<html>Service unavailable</html>"
+        mock_request.return_value = response
+
+        with pytest.raises(SystemExit):
+            airtable.get("key", "https://airtable.com/app123/tbl456/viw789")
+
+    def test_should_exit_when_credentials_missing(self):
+        """Test that missing credentials are rejected before any request."""
+        with pytest.raises(SystemExit):
+            airtable.get("", "https://airtable.com/app123/tbl456/viw789")
+
+
+class TestAirtableSession:
+    """Test the shared HTTP session."""
+
+    @patch("sources.airtable._SESSION", None)
+    def test_should_create_session_once(self):
+        """Test that repeated calls return the same session."""
+        assert airtable.session() is airtable.session()
+
+    @patch("sources.airtable._SESSION", None)
+    def test_should_retry_rate_limits_and_server_errors(self):
+        """Test that the HTTPS adapter retries 429 and 5xx responses."""
+        adapter = airtable.session().get_adapter("https://api.airtable.com/")
+        retries = adapter.max_retries
+
+        assert retries.total == 3
+        assert retries.read is False
+        assert {429, 500, 502, 503, 504} <= set(retries.status_forcelist)
+        # Exhausted retries must still reach request()'s status handling
+        assert retries.raise_on_status is False
+
+    @patch("sources.airtable._SESSION", None)
+    def test_should_exit_with_timeout_message_without_retrying_reads(self):
+        """Test that a read timeout is reported as a timeout after one attempt."""
+        # Arrange - a local server that accepts connections but never replies
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(5)
+        url = f"http://127.0.0.1:{server.getsockname()[1]}/"
+        session = airtable.session()
+        session.mount("http://", session.get_adapter("https://api.airtable.com/"))
+
+        # Act & Assert
+        try:
+            with patch("builtins.print") as mock_print:
+                with pytest.raises(SystemExit):
+                    airtable.request(url, {}, timeout=0.2)
+
+            # Every attempt leaves a connection queued on the listener
+            server.setblocking(False)
+            attempts = 0
+            while True:
+                try:
+                    server.accept()[0].close()
+                except BlockingIOError:
+                    break
+                attempts += 1
+        finally:
+            server.close()
+
+        assert attempts == 1
+        assert "timed out" in mock_print.call_args_list[0][0][0]
+
+    @patch("sources.airtable.session")
+    def test_should_send_requests_through_shared_session(self, mock_session):
+        """Test that request() uses the shared session."""
+        mock_session.return_value.get.return_value = Mock()
+
+        airtable.request("https://api.airtable.com/v0/app1/tbl1", {}, params={})
+
+        mock_session.return_value.get.assert_called_once_with(
+            "https://api.airtable.com/v0/app1/tbl1", headers={}, params={}, timeout=30
+        )
+
+    @patch("sources.airtable.session")
+    def test_should_exit_with_rate_limit_message_after_retries(self, mock_session):
+        """Test that a 429 left after retries is reported to the user."""
+        import requests
+
+        response = Mock(status_code=429)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+        mock_session.return_value.get.return_value = response
+
+        with patch("builtins.print") as mock_print:
+            with pytest.raises(SystemExit):
+                airtable.request("https://api.airtable.com/v0/app1/tbl1", {})
+
+        assert "rate limit" in mock_print.call_args[0][0]
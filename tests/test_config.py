@@ -2,12 +2,7 @@
 
 import os
 import pytest
-from unittest.mock import patch, mock_open
-import sys
-import tempfile
-
-# Add parent directory to path for imports
-sys.path.insert(0, "..")
+from unittest.mock import patch
 
 import config
 
@@ -96,6 +91,14 @@ class TestConfigRequire:
 class TestConfigValidate:
     """Test configuration validation functionality."""
 
+    def setup_method(self):
+        """Start each test without a cached configuration."""
+        config.invalidate()
+
+    def teardown_method(self):
+        """Don't leak test configuration into other tests."""
+        config.invalidate()
+
     @patch.dict(
         os.environ,
         {
@@ -113,13 +116,12 @@ class TestConfigValidate:
 
         # Assert
         mock_load.assert_called_once()
-        assert result["AIRTABLE_API_KEY"] == "test_api_key"
-        assert (
-            result["AIRTABLE_VIEW_URL"] == "https://airtable.com/app123/tbl456/viw789"
-        )
-        assert "GR_COLUMNS" in result
-        assert "GR_HEADERS" in result
-        assert "FAC_CLI_DEBUG" in result
+        assert isinstance(result, config.Config)
+        assert result.airtable_api_key == "test_api_key"
+        assert result.airtable_view_url == "https://airtable.com/app123/tbl456/viw789"
+        assert result.gr_columns
+        assert result.gr_headers
+        assert result.debug is False
 
     @patch.dict(
         os.environ,
@@ -138,9 +140,9 @@ class TestConfigValidate:
         result = config.validate()
 
         # Assert
-        assert result["GR_COLUMNS"] == "Custom,Columns"
-        assert result["GR_HEADERS"] == "Custom Headers,More Headers"
-        assert result["FAC_CLI_DEBUG"] == True
+        assert result.gr_columns == ("Custom", "Columns")
+        assert result.gr_headers == ("Custom Headers", "More Headers")
+        assert result.debug is True
 
     @patch.dict(
         os.environ,
@@ -156,12 +158,14 @@ class TestConfigValidate:
         result = config.validate()
 
         # Assert
-        assert result["GR_COLUMNS"] == "Name,Email,Status,Date"
-        assert (
-            result["GR_HEADERS"]
-            == "Student Name,Email Address,Current Status,Last Updated"
+        assert result.gr_columns == ("Name", "Email", "Status", "Date")
+        assert result.gr_headers == (
+            "Student Name",
+            "Email Address",
+            "Current Status",
+            "Last Updated",
         )
-        assert result["FAC_CLI_DEBUG"] == False
+        assert result.debug is False
 
     @patch.dict(os.environ, {"AIRTABLE_API_KEY": "test_api_key"}, clear=True)
     @patch("config.load")
@@ -197,6 +201,116 @@ class TestConfigValidate:
 
         assert exit_info.value.code == 1
 
+    @patch.dict(
+        os.environ,
+        {
+            "AIRTABLE_API_KEY": "test_api_key",
+            "AIRTABLE_VIEW_URL": "https://airtable.com/app123/tbl456/viw789",
+            "GR_COLUMNS": "Name, Email",
+            "GR_HEADERS": "Student Name,Email Address",
+        },
+    )
+    @patch("config.load")
+    def test_should_parse_display_columns_and_headers(self, mock_load):
+        """Test that column and header lists are parsed during validation."""
+        # Act
+        result = config.validate()
+
+        # Assert
+        assert result.gr_columns == ("Name", "Email")
+        assert result.gr_headers == ("Student Name", "Email Address")
+
+    @patch.dict(
+        os.environ,
+        {
+            "AIRTABLE_API_KEY": "test_api_key",
+            "AIRTABLE_VIEW_URL": "https://airtable.com/app123/tbl456/viw789",
+            "GR_COLUMNS": "Name,Email,Status",
+            "GR_HEADERS": "Student Name,Email Address",
+        },
+    )
+    @patch("config.load")
+    def test_should_exit_when_columns_and_headers_mismatch(self, mock_load):
+        """Test system exit when column and header counts differ."""
+        # Act & Assert
+        with pytest.raises(SystemExit) as exit_info:
+            config.validate()
+
+        assert exit_info.value.code == 1
+
+    @patch.dict(
+        os.environ,
+        {
+            "AIRTABLE_API_KEY": "test_api_key",
+            "AIRTABLE_VIEW_URL": "https://airtable.com/app123/tbl456/viw789",
+        },
+    )
+    @patch("config.load")
+    def test_should_return_cached_config_on_repeated_calls(self, mock_load):
+        """Test that repeated validation reuses the first result."""
+        # Act
+        first = config.validate()
+        second = config.validate()
+
+        # Assert
+        mock_load.assert_called_once()
+        assert second is first
+
+    @patch.dict(
+        os.environ,
+        {
+            "AIRTABLE_API_KEY": "test_api_key",
+            "AIRTABLE_VIEW_URL": "https://airtable.com/app123/tbl456/viw789",
+        },
+    )
+    @patch("config.load")
+    def test_should_reload_config_after_invalidate(self, mock_load):
+        """Test that invalidate forces the next validation to reload."""
+        # Act
+        first = config.validate()
+        config.invalidate()
+        second = config.validate()
+
+        # Assert
+        assert mock_load.call_count == 2
+        assert second is not first
+
+
+class TestConfigParseList:
+    """Test comma-separated list parsing."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("Name,Email,Status,Date", ["Name", "Email", "Status", "Date"]),
+            ("Name, Email , Status ,Date", ["Name", "Email", "Status", "Date"]),
+            ("", []),
+            ("Name,,Email, ,Status", ["Name", "Email", "Status"]),
+            ("Name", ["Name"]),
+            ("Name,Email,Status,", ["Name", "Email", "Status"]),
+            (
+                "Full Name,Email Address,Account Status",
+                ["Full Name", "Email Address", "Account Status"],
+            ),
+        ],
+        ids=[
+            "comma-separated",
+            "spaces-around-commas",
+            "empty-string",
+            "empty-names",
+            "single-name",
+            "trailing-comma",
+            "spaces-within-names",
+        ],
+    )
+    def test_should_split_strip_and_drop_empty_names(self, value, expected):
+        """Test parsing of comma-separated names."""
+        # Act
+        result = config.parse_list(value)
+
+        # Assert
+        assert result == expected
+
 
 class TestConfigError:
     """Test error handling functionality."""
@@ -2,11 +2,6 @@
 
 import pytest
 import sys
-from unittest.mock import patch, Mock
-from io import StringIO
-
-# Add parent directory to path for imports
-sys.path.insert(0, "..")
 
 import display
 
@@ -112,25 +107,68 @@ class TestDisplayFormat:
 class TestDisplayTable:
     """Test table formatting functionality."""
 
-    @patch("display.tabulate")
-    def test_should_create_table_with_grid_format_by_default(self, mock_tabulate):
+    def test_should_create_table_with_grid_format_by_default(self, mocker):
         """Test table creation with default grid format."""
         # Arrange
+        mock_tabulate = mocker.patch("display.tabulate")
         data = [["John", "john@example.com"], ["Jane", "jane@example.com"]]
         headers = ["Name", "Email"]
+
+        # Act
+        result = display.table(data, headers)
+
+        # Assert
+        mock_tabulate.assert_not_called()
+        assert result == "\n".join(
+            [
+                "+--------+------------------+",
+                "| Name   | Email            |",
+                "+========+==================+",
+                "| John   | john@example.com |",
+                "+--------+------------------+",
+                "| Jane   | jane@example.com |",
+                "+--------+------------------+",
+            ]
+        )
+
+    def test_should_use_tabulate_for_multiline_cells(self, mocker):
+        """Test that grid tables with line breaks fall back to tabulate."""
+        # Arrange
+        mock_tabulate = mocker.patch("display.tabulate")
+        data = [["John", "line one\nline two"]]
+        headers = ["Name", "Notes"]
+        mock_tabulate.return_value = "formatted_table"
+
+        # Act
+        result = display.table(data, headers)
+
+        # Assert
+        mock_tabulate.assert_called_once_with(
+            data, headers=headers, tablefmt="grid", disable_numparse=True
+        )
+        assert result == "formatted_table"
+
+    def test_should_use_tabulate_for_non_ascii_cells(self, mocker):
+        """Test that wide characters fall back to tabulate's width handling."""
+        # Arrange
+        mock_tabulate = mocker.patch("display.tabulate")
+        data = [["日本", "jp@example.com"]]
+        headers = ["Name", "Email"]
         mock_tabulate.return_value = "formatted_table"
 
         # Act
         result = display.table(data, headers)
 
         # Assert
-        mock_tabulate.assert_called_once_with(data, headers=headers, tablefmt="grid")
+        mock_tabulate.assert_called_once_with(
+            data, headers=headers, tablefmt="grid", disable_numparse=True
+        )
         assert result == "formatted_table"
 
-    @patch("display.tabulate")
-    def test_should_create_table_with_custom_style(self, mock_tabulate):
+    def test_should_create_table_with_custom_style(self, mocker):
         """Test table creation with custom style."""
         # Arrange
+        mock_tabulate = mocker.patch("display.tabulate")
         data = [["John", "john@example.com"]]
         headers = ["Name", "Email"]
         mock_tabulate.return_value = "formatted_table"
@@ -139,7 +177,9 @@ class TestDisplayTable:
         result = display.table(data, headers, style="simple")
 
         # Assert
-        mock_tabulate.assert_called_once_with(data, headers=headers, tablefmt="simple")
+        mock_tabulate.assert_called_once_with(
+            data, headers=headers, tablefmt="simple", disable_numparse=True
+        )
         assert result == "formatted_table"
 
     def test_should_return_no_data_message_for_empty_data(self):
@@ -154,32 +194,93 @@ class TestDisplayTable:
         # Assert
         assert result == "No data to display"
 
-    @patch("display.tabulate")
-    def test_should_handle_tabulate_errors_gracefully(self, mock_tabulate):
+    def test_should_handle_tabulate_errors_gracefully(self, mocker):
         """Test error handling when tabulate fails."""
         # Arrange
+        mocker.patch("display.tabulate", side_effect=Exception("Tabulate error"))
         data = [["John", "john@example.com"]]
         headers = ["Name", "Email"]
-        mock_tabulate.side_effect = Exception("Tabulate error")
 
         # Act & Assert
         with pytest.raises(SystemExit) as exit_info:
-            display.table(data, headers)
+            display.table(data, headers, style="simple")
 
         assert exit_info.value.code == 1
 
 
+class TestDisplayGrid:
+    """Test the built-in grid renderer."""
+
+    def test_should_match_tabulate_grid_output(self):
+        """Test that grid output is identical to tabulate's grid format."""
+        from tabulate import tabulate
+
+        # Arrange
+        data = [["John Doe", "", "active"], ["Al", "al@example.com", "x"]]
+        headers = ["Full Name", "Email", "S"]
+
+        # Act
+        result = display.grid(data, headers)
+
+        # Assert
+        assert result == tabulate(
+            data, headers=headers, tablefmt="grid", disable_numparse=True
+        )
+
+    def test_should_match_tabulate_for_representative_record(self):
+        """Test grid output against tabulate for a padded, truncated row."""
+        from tabulate import tabulate
+
+        # Arrange - cells as format() produces them, including stray spaces
+        record = {
+            "Name": "  Jane Smith ",
+            "Email": "jane@example.com",
+            "Status": "active\t",
+            "Notes": "x" * 60,
+        }
+        columns = ["Name", "Email", "Status", "Notes"]
+        headers = ["Student Name", "Email Address", "Current Status", "Notes"]
+        data = display.format([record], columns, headers)
+
+        # Act
+        result = display.grid(data, headers)
+
+        # Assert
+        assert result == tabulate(
+            data, headers=headers, tablefmt="grid", disable_numparse=True
+        )
+
+    def test_should_render_numeric_cells_the_same_on_both_paths(self):
+        """Test that a non-ASCII cell doesn't change how numbers render."""
+        # Arrange - identical tables except one name needs the tabulate path
+        headers = ["Price", "Count", "Limit", "Total", "Family name"]
+        ascii_rows = [
+            ["1.50", "1e3", "inf", "1,000", "Zoe"],
+            ["-2", "0x1F", "nan", "12", "Al"],
+        ]
+        accented_rows = [
+            ["1.50", "1e3", "inf", "1,000", "Zoë"],
+            ["-2", "0x1F", "nan", "12", "Al"],
+        ]
+
+        # Act
+        fast = display.table(ascii_rows, headers)
+        fallback = display.table(accented_rows, headers)
+
+        # Assert
+        assert fallback.replace("Zoë", "Zoe") == fast
+        assert "| 1.50    | 1e3     | inf     | 1,000   | Zoe           |" in fast
+
+
 class TestDisplayPrintTable:
     """Test complete table printing functionality."""
 
-    @patch("display.print")
-    @patch("display.format")
-    @patch("display.table")
-    def test_should_print_formatted_table_for_valid_data(
-        self, mock_table, mock_format, mock_print
-    ):
+    def test_should_print_formatted_table_for_valid_data(self, mocker):
         """Test complete table printing workflow."""
         # Arrange
+        mock_stdout = mocker.patch("sys.stdout")
+        mock_format = mocker.patch("display.format")
+        mock_table = mocker.patch("display.table")
         data = [{"name": "John", "email": "john@example.com"}]
         columns = ["name", "email"]
         headers = ["Name", "Email"]
@@ -193,12 +294,13 @@ class TestDisplayPrintTable:
         # Assert
         mock_format.assert_called_once_with(data, columns, headers)
         mock_table.assert_called_once_with([["John", "john@example.com"]], headers)
-        mock_print.assert_called_once_with("formatted_table_output")
+        mock_stdout.write.assert_called_once_with("formatted_table_output\n")
+        mock_stdout.flush.assert_called_once()
 
-    @patch("builtins.print")
-    def test_should_print_no_data_message_for_empty_data(self, mock_print):
+    def test_should_print_no_data_message_for_empty_data(self, mocker):
         """Test printing when no data is available."""
         # Arrange
+        mock_print = mocker.patch("builtins.print")
         data = []
         columns = ["name", "email"]
         headers = ["Name", "Email"]
@@ -213,36 +315,44 @@ class TestDisplayPrintTable:
 class TestDisplayMessages:
     """Test message printing functionality."""
 
-    @patch("builtins.print")
-    def test_should_print_success_message_with_checkmark(self, mock_print):
+    def test_should_print_success_message_with_checkmark(self, mocker):
         """Test success message formatting."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         display.print_success("Operation completed")
 
         # Assert
         mock_print.assert_called_once_with("✓ Operation completed")
 
-    @patch("builtins.print")
-    def test_should_print_info_message_with_info_icon(self, mock_print):
+    def test_should_print_info_message_with_info_icon(self, mocker):
         """Test info message formatting."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         display.print_info("Processing data")
 
         # Assert
         mock_print.assert_called_once_with("ℹ Processing data")
 
-    @patch("builtins.print")
-    def test_should_print_warning_message_to_stderr(self, mock_print):
+    def test_should_print_warning_message_to_stderr(self, mocker):
         """Test warning message is printed to stderr."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         display.print_warning("Warning message")
 
         # Assert
         mock_print.assert_called_once_with("⚠ Warning message", file=sys.stderr)
 
-    @patch("builtins.print")
-    def test_should_print_error_message_to_stderr(self, mock_print):
+    def test_should_print_error_message_to_stderr(self, mocker):
         """Test error message is printed to stderr."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         display.print_error("Error occurred")
 
@@ -250,12 +360,111 @@ class TestDisplayMessages:
         mock_print.assert_called_once_with("✗ Error occurred", file=sys.stderr)
 
 
+class TestDisplayBatch:
+    """Test batched stdout output."""
+
+    def test_should_write_batched_output_once(self, mocker):
+        """Test that output inside a batch is written in one call on exit."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+        mock_stdout = mocker.patch("sys.stdout")
+
+        # Act
+        with display.batch():
+            display.print_info("Loading")
+            display.print_success("Done")
+
+            # Assert - nothing written until the batch closes
+            mock_stdout.write.assert_not_called()
+
+        mock_print.assert_not_called()
+        mock_stdout.write.assert_called_once_with("ℹ Loading\n✓ Done\n")
+        mock_stdout.flush.assert_called_once()
+
+    def test_should_collect_nested_batches_into_outer_write(self, mocker):
+        """Test that a nested batch defers to the enclosing one."""
+        # Arrange
+        mock_stdout = mocker.patch("sys.stdout")
+
+        # Act
+        with display.batch():
+            with display.batch():
+                display.print_info("Inner")
+            display.print_info("Outer")
+
+        # Assert
+        mock_stdout.write.assert_called_once_with("ℹ Inner\nℹ Outer\n")
+
+    def test_should_flush_batched_output_when_block_fails(self, mocker):
+        """Test that output collected before an error is still written."""
+        # Arrange
+        mock_stdout = mocker.patch("sys.stdout")
+
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            with display.batch():
+                display.print_info("Partial")
+                sys.exit(1)
+
+        mock_stdout.write.assert_called_once_with("ℹ Partial\n")
+
+    def test_should_keep_stderr_messages_immediate(self, mocker):
+        """Test that warnings are not held back by a batch."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+        mock_stdout = mocker.patch("sys.stdout")
+
+        # Act
+        with display.batch():
+            display.print_warning("Careful")
+
+            # Assert
+            mock_print.assert_called_once_with("⚠ Careful", file=sys.stderr)
+
+        mock_stdout.write.assert_not_called()
+
+
+class TestDisplayWrite:
+    """Test direct stdout writes."""
+
+    def test_should_write_and_flush_once(self, mocker):
+        """Test that text is written in one call and flushed."""
+        # Arrange
+        mock_stdout = mocker.patch("sys.stdout")
+
+        # Act
+        display.write("line one\nline two\n")
+
+        # Assert
+        mock_stdout.write.assert_called_once_with("line one\nline two\n")
+        mock_stdout.flush.assert_called_once()
+
+    def test_should_redirect_stdout_when_pipe_closed(self, mocker):
+        """Test that a closed pipe doesn't raise and stdout goes to devnull."""
+        # Arrange
+        mock_close = mocker.patch("os.close")
+        mock_dup2 = mocker.patch("os.dup2")
+        mocker.patch("os.open", return_value=99)
+        mock_stdout = mocker.patch("sys.stdout")
+        mock_stdout.write.side_effect = BrokenPipeError()
+        mock_stdout.fileno.return_value = 1
+
+        # Act - should not raise
+        display.write("table\n")
+
+        # Assert
+        mock_dup2.assert_called_once_with(99, 1)
+        mock_close.assert_called_once_with(99)
+
+
 class TestDisplayError:
     """Test error handling functionality."""
 
-    @patch("display.print_error")
-    def test_should_print_error_and_exit_with_default_code(self, mock_print_error):
+    def test_should_print_error_and_exit_with_default_code(self, mocker):
         """Test error function prints and exits with default code."""
+        # Arrange
+        mock_print_error = mocker.patch("display.print_error")
+
         # Act & Assert
         with pytest.raises(SystemExit) as exit_info:
             display.error("Test error message")
@@ -263,9 +472,11 @@ class TestDisplayError:
         mock_print_error.assert_called_once_with("Test error message")
         assert exit_info.value.code == 1
 
-    @patch("display.print_error")
-    def test_should_print_error_and_exit_with_custom_code(self, mock_print_error):
+    def test_should_print_error_and_exit_with_custom_code(self, mocker):
         """Test error function prints and exits with custom code."""
+        # Arrange
+        mock_print_error = mocker.patch("display.print_error")
+
         # Act & Assert
         with pytest.raises(SystemExit) as exit_info:
             display.error("Custom error", 42)
@@ -1,12 +1,10 @@
 """Tests for main FAC CLI module."""
 
+import pathlib
 import pytest
+import subprocess
 import sys
-from unittest.mock import patch, Mock
-from io import StringIO
-
-# Add parent directory to path for imports
-sys.path.insert(0, "..")
+from unittest.mock import patch
 
 import fac
 
@@ -62,30 +60,27 @@ class TestFacParse:
         assert command == "gr"
         assert cmd_args == ["--verbose", "--limit", "10"]
 
-    def test_should_handle_help_flags(self):
+    @pytest.mark.parametrize("help_flag", ["help", "--help", "-h"])
+    def test_should_handle_help_flags(self, help_flag):
         """Test parsing of help flags as commands."""
-        # Test cases for different help variations
-        help_variations = ["help", "--help", "-h"]
-
-        for help_flag in help_variations:
-            # Arrange
-            args = ["fac.py", help_flag]
+        # Arrange
+        args = ["fac.py", help_flag]
 
-            # Act
-            command, cmd_args = fac.parse(args)
+        # Act
+        command, cmd_args = fac.parse(args)
 
-            # Assert
-            assert command == help_flag
-            assert cmd_args == []
+        # Assert
+        assert command == help_flag
+        assert cmd_args == []
 
 
 class TestFacRoute:
     """Test command routing functionality."""
 
-    @patch("fac.dispatch")
-    def test_should_route_to_dispatch_with_parsed_args(self, mock_dispatch):
+    def test_should_route_to_dispatch_with_parsed_args(self, mocker):
         """Test that route calls dispatch with parsed arguments."""
         # Arrange
+        mock_dispatch = mocker.patch("fac.dispatch")
         args = ["fac.py", "gr", "--verbose"]
 
         # Act
@@ -94,13 +89,11 @@ class TestFacRoute:
         # Assert
         mock_dispatch.assert_called_once_with("gr", ["--verbose"])
 
-    @patch("fac.parse")
-    @patch("fac.dispatch")
-    def test_should_use_parse_function_for_argument_processing(
-        self, mock_dispatch, mock_parse
-    ):
+    def test_should_use_parse_function_for_argument_processing(self, mocker):
         """Test that route uses parse function for processing arguments."""
         # Arrange
+        mock_parse = mocker.patch("fac.parse")
+        mock_dispatch = mocker.patch("fac.dispatch")
         args = ["fac.py", "test_command"]
         mock_parse.return_value = ("test_command", [])
 
@@ -115,56 +108,60 @@ class TestFacRoute:
 class TestFacDispatch:
     """Test command dispatch functionality."""
 
-    @patch("fac.show_help")
-    def test_should_show_help_for_help_command(self, mock_show_help):
+    @pytest.mark.parametrize("help_cmd", ["help", "--help", "-h"])
+    def test_should_show_help_for_help_command(self, mocker, help_cmd):
         """Test that help commands show help without validation."""
-        # Test all help command variations
-        help_commands = ["help", "--help", "-h"]
-
-        for help_cmd in help_commands:
-            mock_show_help.reset_mock()
+        # Arrange
+        mock_show_help = mocker.patch("fac.show_help")
 
-            # Act
-            fac.dispatch(help_cmd, [])
+        # Act
+        fac.dispatch(help_cmd, [])
 
-            # Assert
-            mock_show_help.assert_called_once()
+        # Assert
+        mock_show_help.assert_called_once()
 
-    @patch("config.validate")
-    @patch("fac.run_gr")
     def test_should_execute_gr_command_with_validation(
-        self, mock_run_gr, mock_validate
+        self, mocker, mock_validate, valid_config
     ):
         """Test that gr command is executed with configuration validation."""
         # Arrange
-        mock_validate.return_value = {"AIRTABLE_API_KEY": "test"}
+        mock_run_gr = mocker.patch("fac.run_gr")
 
         # Act
         fac.dispatch("gr", ["--verbose"])
 
         # Assert
         mock_validate.assert_called_once()
-        mock_run_gr.assert_called_once_with(["--verbose"])
+        mock_run_gr.assert_called_once_with(["--verbose"], valid_config)
+
+    def test_should_not_run_command_when_validation_fails(self, mocker, mock_validate):
+        """Test that commands don't run when configuration is invalid."""
+        # Arrange
+        mock_run_gr = mocker.patch("fac.run_gr")
+        mock_validate.side_effect = SystemExit(1)
+
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            fac.dispatch("gr", [])
 
-    @patch("fac.show_error")
-    def test_should_show_error_for_unknown_command(self, mock_show_error):
+        mock_run_gr.assert_not_called()
+
+    def test_should_show_error_for_unknown_command(self, mocker):
         """Test that unknown commands show error."""
+        # Arrange
+        mock_show_error = mocker.patch("fac.show_error")
+
         # Act
         fac.dispatch("unknown_command", [])
 
         # Assert
         mock_show_error.assert_called_once_with("Unknown command: unknown_command")
 
-    @patch("config.validate")
-    @patch("fac.run_gr")
-    @patch("builtins.print")
-    def test_should_handle_keyboard_interrupt_gracefully(
-        self, mock_print, mock_run_gr, mock_validate
-    ):
+    def test_should_handle_keyboard_interrupt_gracefully(self, mocker, mock_validate):
         """Test handling of KeyboardInterrupt (Ctrl+C)."""
         # Arrange
-        mock_validate.return_value = {"AIRTABLE_API_KEY": "test"}
-        mock_run_gr.side_effect = KeyboardInterrupt()
+        mocker.patch("fac.run_gr", side_effect=KeyboardInterrupt())
+        mock_print = mocker.patch("builtins.print")
 
         # Act & Assert
         with pytest.raises(SystemExit) as exit_info:
@@ -175,61 +172,73 @@ class TestFacDispatch:
             "\nOperation cancelled by user", file=sys.stderr
         )
 
-    @patch("config.validate")
-    @patch("fac.run_gr")
-    @patch("builtins.print")
     def test_should_handle_general_exceptions_in_non_debug_mode(
-        self, mock_print, mock_run_gr, mock_validate
+        self, mocker, mock_validate
     ):
         """Test handling of general exceptions in non-debug mode."""
         # Arrange
-        mock_validate.return_value = {"AIRTABLE_API_KEY": "test"}
-        mock_run_gr.side_effect = Exception("Test error")
+        mocker.patch("fac.run_gr", side_effect=Exception("Test error"))
+        mock_print = mocker.patch("builtins.print")
 
-        with patch("config.get", return_value="false"):
-            # Act & Assert
-            with pytest.raises(SystemExit) as exit_info:
-                fac.dispatch("gr", [])
+        # Act & Assert
+        with pytest.raises(SystemExit) as exit_info:
+            fac.dispatch("gr", [])
 
         assert exit_info.value.code == 1
         mock_print.assert_called_once_with("Error: Test error", file=sys.stderr)
 
-    @patch("config.validate")
-    @patch("fac.run_gr")
-    def test_should_reraise_exceptions_in_debug_mode(self, mock_run_gr, mock_validate):
+    def test_should_reraise_exceptions_in_debug_mode(
+        self, mocker, mock_validate, valid_config
+    ):
         """Test that exceptions are re-raised in debug mode."""
         # Arrange
-        mock_validate.return_value = {"AIRTABLE_API_KEY": "test"}
-        mock_run_gr.side_effect = ValueError("Debug test error")
+        mock_validate.return_value = valid_config._replace(debug=True)
+        mocker.patch("fac.run_gr", side_effect=ValueError("Debug test error"))
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            fac.dispatch("gr", [])
+
+        assert "Debug test error" in str(exc_info.value)
+
+    def test_should_use_validated_debug_flag_not_environment(
+        self, mocker, mock_validate
+    ):
+        """Test that debug mode follows the validated config, not a re-read."""
+        # Arrange
+        mocker.patch("fac.run_gr", side_effect=ValueError("Test error"))
+        mocker.patch("builtins.print")
+        mocker.patch.dict("os.environ", {"FAC_CLI_DEBUG": "true"})
 
-        with patch("config.get", return_value="true"):
-            # Act & Assert
-            with pytest.raises(ValueError, match="Debug test error"):
-                fac.dispatch("gr", [])
+        # Act & Assert
+        with pytest.raises(SystemExit) as exit_info:
+            fac.dispatch("gr", [])
+
+        assert exit_info.value.code == 1
 
 
 class TestFacRunGr:
     """Test gr command execution."""
 
-    @patch("commands.gr.run")
-    def test_should_import_and_execute_gr_command(self, mock_gr_run):
+    def test_should_import_and_execute_gr_command(self, mocker, valid_config):
         """Test that gr command is imported and executed correctly."""
         # Arrange
+        mock_gr_run = mocker.patch("commands.gr.run")
         args = ["--verbose", "--limit", "10"]
 
         # Act
-        fac.run_gr(args)
+        fac.run_gr(args, valid_config)
 
         # Assert
-        mock_gr_run.assert_called_once_with(args)
+        mock_gr_run.assert_called_once_with(args, valid_config)
 
-    @patch("config.error")
-    def test_should_handle_import_error_gracefully(self, mock_config_error):
+    def test_should_handle_import_error_gracefully(self, mocker, valid_config):
         """Test handling when gr module cannot be imported."""
         # Arrange
+        mock_config_error = mocker.patch("config.error")
         with patch("builtins.__import__", side_effect=ImportError("Module not found")):
             # Act
-            fac.run_gr([])
+            fac.run_gr([], valid_config)
 
         # Assert
         mock_config_error.assert_called_once_with(
@@ -240,9 +249,11 @@ class TestFacRunGr:
 class TestFacShowHelp:
     """Test help display functionality."""
 
-    @patch("builtins.print")
-    def test_should_display_complete_help_text(self, mock_print):
+    def test_should_display_complete_help_text(self, mocker):
         """Test that complete help text is displayed."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         fac.show_help()
 
@@ -260,9 +271,11 @@ class TestFacShowHelp:
         assert "Configuration:" in help_text
         assert ".env" in help_text
 
-    @patch("builtins.print")
-    def test_should_include_all_available_commands(self, mock_print):
+    def test_should_include_all_available_commands(self, mocker):
         """Test that all available commands are shown in help."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act
         fac.show_help()
 
@@ -282,9 +295,11 @@ class TestFacShowHelp:
 class TestFacShowError:
     """Test error display functionality."""
 
-    @patch("builtins.print")
-    def test_should_print_error_message_to_stderr(self, mock_print):
+    def test_should_print_error_message_to_stderr(self, mocker):
         """Test that error message is printed to stderr."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Act & Assert
         with pytest.raises(SystemExit) as exit_info:
             fac.show_error("Test error message")
@@ -309,73 +324,71 @@ class TestFacShowError:
 class TestFacMain:
     """Test main entry point functionality."""
 
-    @patch("fac.route")
-    @patch("sys.argv", ["fac.py", "gr"])
-    def test_should_call_route_with_sys_argv(self, mock_route):
+    def test_should_call_route_with_sys_argv(self, mocker):
         """Test that main calls route with sys.argv."""
+        # Arrange
+        mock_route = mocker.patch("fac.route")
+        mocker.patch("sys.argv", ["fac.py", "gr"])
+
         # Act
         fac.main()
 
         # Assert
         mock_route.assert_called_once_with(["fac.py", "gr"])
 
-    @patch("fac.route")
-    def test_should_handle_route_exceptions(self, mock_route):
+    def test_should_handle_route_exceptions(self, mocker):
         """Test that main handles exceptions from route."""
         # Arrange - route should handle its own exceptions and exit gracefully
-        mock_route.side_effect = SystemExit(1)  # Route exits on error
+        mocker.patch("fac.route", side_effect=SystemExit(1))  # Route exits on error
+        mocker.patch("sys.argv", ["fac.py", "test"])
 
         # Act & Assert - should propagate SystemExit from route
-        with patch("sys.argv", ["fac.py", "test"]):
-            with pytest.raises(SystemExit) as exit_info:
-                fac.main()
-            assert exit_info.value.code == 1
+        with pytest.raises(SystemExit) as exit_info:
+            fac.main()
+        assert exit_info.value.code == 1
 
 
 class TestFacIntegration:
     """Integration tests for main CLI functionality."""
 
-    @patch("commands.gr.run")
-    @patch("config.validate")
-    def test_should_execute_complete_gr_command_workflow(
-        self, mock_validate, mock_gr_run
-    ):
+    @pytest.mark.slow
+    def test_should_execute_complete_gr_command_workflow(self, mocker, mock_validate):
         """Test complete workflow for gr command execution."""
         # Arrange
-        mock_validate.return_value = {
-            "AIRTABLE_API_KEY": "test_key",
-            "AIRTABLE_VIEW_URL": "https://airtable.com/app123/tbl456/viw789",
-        }
+        mock_gr_run = mocker.patch("commands.gr.run")
 
         # Act
         fac.route(["fac.py", "gr", "--verbose"])
 
         # Assert
         mock_validate.assert_called_once()
-        mock_gr_run.assert_called_once_with(["--verbose"])
+        mock_gr_run.assert_called_once_with(["--verbose"], mock_validate.return_value)
 
-    @patch("fac.show_help")
-    def test_should_show_help_for_various_help_requests(self, mock_show_help):
-        """Test that various help requests all show help."""
-        help_requests = [
+    @pytest.mark.parametrize(
+        "args",
+        [
             ["fac.py"],
             ["fac.py", "help"],
             ["fac.py", "--help"],
             ["fac.py", "-h"],
-        ]
-
-        for args in help_requests:
-            mock_show_help.reset_mock()
+        ],
+    )
+    def test_should_show_help_for_various_help_requests(self, mocker, args):
+        """Test that various help requests all show help."""
+        # Arrange
+        mock_show_help = mocker.patch("fac.show_help")
 
-            # Act
-            fac.route(args)
+        # Act
+        fac.route(args)
 
-            # Assert
-            mock_show_help.assert_called_once()
+        # Assert
+        mock_show_help.assert_called_once()
 
-    @patch("builtins.print")
-    def test_should_handle_error_cases_appropriately(self, mock_print):
+    def test_should_handle_error_cases_appropriately(self, mocker):
         """Test error handling for various error conditions."""
+        # Arrange
+        mock_print = mocker.patch("builtins.print")
+
         # Test unknown command
         with pytest.raises(SystemExit):
             fac.route(["fac.py", "unknown_command"])
@@ -385,3 +398,25 @@ class TestFacIntegration:
             "Unknown command: unknown_command" in str(call)
             for call in mock_print.call_args_list
         )
+
+    @pytest.mark.slow
+    def test_should_not_import_heavy_dependencies_for_help(self):
+        """Test that the help path stays free of third-party imports."""
+        # Arrange - a fresh interpreter, so earlier tests can't pre-import
+        script = (
+            "import sys, fac; fac.route(['fac.py', 'help']); "
+            "print(sorted({'requests', 'tabulate', 'dotenv', 'display', "
+            "'commands.gr'} & set(sys.modules)))"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=pathlib.Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        assert result.stdout.splitlines()[-1] == "[]"